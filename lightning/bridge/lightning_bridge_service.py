@@ -10,10 +10,11 @@ Architecture:
 Endpoints:
     POST /session/start - Start a new session
     POST /tool/trace - Record a tool call
+    POST /tool/trace_batch - Record several tool calls at once
     POST /session/reward - Emit reward for completed session
     POST /session/end - End session
     GET /health - Health check
-    GET /stats - Get current statistics
+    GET /stats - Get current statistics (?full=1 lists every session)
 
 Usage:
     # Start the service
@@ -23,19 +24,43 @@ Usage:
     curl -X POST http://localhost:8765/session/start \\
          -H "Content-Type: application/json" \\
          -d '{"message": "test"}'
+
+Batching:
+    Sessions that call many tools should buffer traces on the Node side and
+    send them in one request (LightningClient.queueToolTrace() in
+    openclaw-client.ts flushes on a 50ms debounce):
+    
+    POST /tool/trace_batch
+        {"session_id": "...", "tools": [{"tool_name": "read", "params": {...}}, ...]}
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
-from pathlib import Path
+from typing import Dict, Any
 
 from aiohttp import web
 from openclaw_integration import OpenClawLightningTracer
 
+# Fast JSON (C-native, returns bytes) with stdlib fallback
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+    _json_loads = json.loads
+
+# Faster event loop (libuv-based) if installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,49 +68,116 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global tracer instance
-tracer: Optional[OpenClawLightningTracer] = None
-current_sessions: Dict[str, Any] = {}
+
+class BridgeSession:
+    """
+    Bookkeeping for one OpenClaw session tracked by the bridge.
+    
+    Slot attributes instead of a per-session dict: a tool trace is a single
+    attribute increment rather than a nested key lookup and store.
+    """
+    
+    __slots__ = ('started_at', 'message', 'tool_count')
+    
+    def __init__(self, started_at: str, message: str):
+        self.started_at = started_at
+        self.message = message
+        self.tool_count = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'started_at': self.started_at,
+            'message': self.message,
+            'tool_count': self.tool_count
+        }
+
+
+# Tracer is created on app startup and shared through the application
+TRACER_KEY = web.AppKey('tracer', OpenClawLightningTracer)
+# Handlers all run on the one asyncio loop, so a plain dict needs no locking
+current_sessions: Dict[str, BridgeSession] = {}
+
+JSON_CONTENT_TYPE = 'application/json'
+
+# Sessions included in /stats unless ?full=1 is passed
+STATS_SAMPLE_SIZE = 10
+
+# Default session ids: a cached prefix plus a monotonic counter
+SESSION_ID_PREFIX = 'session-'
+_session_counter = itertools.count(1)
+
+
+async def read_json(request) -> Any:
+    """Parse the request body straight from raw bytes."""
+    return _json_loads(await request.read())
+
+
+def json_response(data: Any, status: int = 200) -> web.Response:
+    """Encode data as a JSON response without aiohttp's stdlib encoder."""
+    return json_bytes_response(_json_dumps(data), status=status)
+
+
+def json_bytes_response(body: bytes, status: int = 200) -> web.Response:
+    """
+    Wrap an already-encoded JSON body in a response.
+    
+    aiohttp (>=3.12) defers headers for a bytes body and sends them
+    together with it in a single write.
+    """
+    return web.Response(body=body, status=status, content_type=JSON_CONTENT_TYPE)
+
+
+# Responses that never change, encoded once at import
+_TRACE_DISABLED_BODY = _json_dumps({'success': True, 'traced': False, 'reason': 'tracing disabled'})
+_REWARD_DISABLED_BODY = _json_dumps({'success': True, 'rewarded': False, 'reason': 'tracing disabled'})
+_END_DISABLED_BODY = _json_dumps({'success': True, 'ended': False, 'reason': 'tracing disabled'})
+_REWARDED_BODY = _json_dumps({'success': True, 'rewarded': True})
+_ENDED_BODY = _json_dumps({'success': True, 'ended': True})
 
 
 async def handle_session_start(request):
     """Start a new Lightning session."""
-    global tracer, current_sessions
+    tracer = request.app[TRACER_KEY]
     
     try:
-        data = await request.json()
-        user_message = data.get('message', '')
-        session_id = data.get('session_id', f"session-{datetime.now().timestamp()}")
-        metadata = data.get('metadata', {})
+        data = await read_json(request)
+        metadata = data.get('metadata') or {}
+        
+        # Reject bad input here; an error inside start_session() would
+        # disable the shared tracer for every session
+        if not isinstance(metadata, dict):
+            return json_response({
+                'success': False,
+                'error': 'metadata must be an object'
+            }, status=400)
         
-        # Initialize tracer if needed
-        if tracer is None:
-            tracer = OpenClawLightningTracer()
+        user_message = data.get('message', '')
+        session_id = data.get('session_id') or SESSION_ID_PREFIX + str(next(_session_counter))
         
         # Start session
         await tracer.start_session(
             user_message=user_message,
-            session_metadata={**metadata, 'bridge_session_id': session_id}
+            session_metadata=metadata,
+            session_id=session_id
         )
         
         # Track session
-        current_sessions[session_id] = {
-            'started_at': datetime.now().isoformat(),
-            'message': user_message,
-            'tool_count': 0
-        }
+        current_sessions[session_id] = BridgeSession(
+            started_at=datetime.now().isoformat(),
+            message=user_message
+        )
         
-        logger.info(f"Started session {session_id}")
+        logger.info("Started session %s", session_id)
         
-        return web.json_response({
+        return json_response({
             'success': True,
             'session_id': session_id,
             'enabled': tracer.enabled
         })
     
     except Exception as e:
-        logger.error(f"Error starting session: {e}")
-        return web.json_response({
+        logger.error("Error starting session: %s", e)
+        return json_response({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -93,37 +185,67 @@ async def handle_session_start(request):
 
 async def handle_tool_trace(request):
     """Record a tool call."""
-    global tracer, current_sessions
+    tracer = request.app[TRACER_KEY]
     
     try:
-        data = await request.json()
+        data = await read_json(request)
         session_id = data.get('session_id')
         tool_name = data.get('tool_name')
         tool_params = data.get('params', {})
         
-        if tracer is None or not tracer.enabled:
-            return web.json_response({
-                'success': True,
-                'traced': False,
-                'reason': 'tracing disabled'
-            })
+        if not tracer.enabled:
+            return json_bytes_response(_TRACE_DISABLED_BODY)
         
         # Track tool call (synchronous wrapper since OpenClaw can't wait)
         # Note: This is a simplified version - real integration would use proper async
-        logger.info(f"Tool trace: {tool_name} (session: {session_id})")
+        logger.info("Tool trace: %s (session: %s)", tool_name, session_id)
         
-        if session_id in current_sessions:
-            current_sessions[session_id]['tool_count'] += 1
+        session = current_sessions.get(session_id)
+        if session is not None:
+            session.tool_count += 1
         
-        return web.json_response({
+        return json_response({
             'success': True,
             'traced': True,
             'tool_name': tool_name
         })
     
     except Exception as e:
-        logger.error(f"Error tracing tool: {e}")
-        return web.json_response({
+        logger.error("Error tracing tool: %s", e)
+        return json_response({
+            'success': False,
+            'error': str(e)
+        }, status=500)
+
+
+async def handle_tool_trace_batch(request):
+    """Record several tool calls from one session in a single request."""
+    tracer = request.app[TRACER_KEY]
+    
+    try:
+        data = await read_json(request)
+        session_id = data.get('session_id')
+        tools = data.get('tools', [])
+        
+        if not tracer.enabled:
+            return json_bytes_response(_TRACE_DISABLED_BODY)
+        
+        tool_names = [tool.get('tool_name') for tool in tools]
+        logger.info("Tool trace batch: %d tools %s (session: %s)", len(tool_names), tool_names, session_id)
+        
+        session = current_sessions.get(session_id)
+        if session is not None:
+            session.tool_count += len(tool_names)
+        
+        return json_response({
+            'success': True,
+            'traced': True,
+            'count': len(tool_names)
+        })
+    
+    except Exception as e:
+        logger.error("Error tracing tool batch: %s", e)
+        return json_response({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -131,22 +253,18 @@ async def handle_tool_trace(request):
 
 async def handle_session_reward(request):
     """Emit reward for completed session."""
-    global tracer
+    tracer = request.app[TRACER_KEY]
     
     try:
-        data = await request.json()
+        data = await read_json(request)
         session_id = data.get('session_id')
         success = data.get('success', False)
         tokens_used = data.get('tokens_used')
         expected_tokens = data.get('expected_tokens')
         duration = data.get('duration')
         
-        if tracer is None or not tracer.enabled:
-            return web.json_response({
-                'success': True,
-                'rewarded': False,
-                'reason': 'tracing disabled'
-            })
+        if not tracer.enabled:
+            return json_bytes_response(_REWARD_DISABLED_BODY)
         
         tracer.emit_task_reward(
             success=success,
@@ -155,16 +273,13 @@ async def handle_session_reward(request):
             duration_seconds=duration
         )
         
-        logger.info(f"Reward emitted for session {session_id}: success={success}")
+        logger.info("Reward emitted for session %s: success=%s", session_id, success)
         
-        return web.json_response({
-            'success': True,
-            'rewarded': True
-        })
+        return json_bytes_response(_REWARDED_BODY)
     
     except Exception as e:
-        logger.error(f"Error emitting reward: {e}")
-        return web.json_response({
+        logger.error("Error emitting reward: %s", e)
+        return json_response({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -172,78 +287,96 @@ async def handle_session_reward(request):
 
 async def handle_session_end(request):
     """End a Lightning session."""
-    global tracer, current_sessions
+    tracer = request.app[TRACER_KEY]
     
     try:
-        data = await request.json()
+        data = await read_json(request)
         session_id = data.get('session_id')
         
-        if tracer is None or not tracer.enabled:
-            if session_id in current_sessions:
-                del current_sessions[session_id]
-            return web.json_response({
-                'success': True,
-                'ended': False,
-                'reason': 'tracing disabled'
-            })
+        if not tracer.enabled:
+            current_sessions.pop(session_id, None)
+            return json_bytes_response(_END_DISABLED_BODY)
         
         await tracer.end_session()
         
-        if session_id in current_sessions:
-            del current_sessions[session_id]
+        current_sessions.pop(session_id, None)
         
-        logger.info(f"Ended session {session_id}")
+        logger.info("Ended session %s", session_id)
         
-        return web.json_response({
-            'success': True,
-            'ended': True
-        })
+        return json_bytes_response(_ENDED_BODY)
     
     except Exception as e:
-        logger.error(f"Error ending session: {e}")
-        return web.json_response({
+        logger.error("Error ending session: %s", e)
+        return json_response({
             'success': False,
             'error': str(e)
         }, status=500)
 
 
+# Constant part of the /health body, with the trailing '}' stripped
+_HEALTH_PREFIX = _json_dumps({
+    'status': 'healthy',
+    'service': 'agent-lightning-bridge'
+})[:-1] + b',"tracing_enabled":'
+
+
 async def handle_health(request):
     """Health check endpoint."""
-    global tracer
-    
-    enabled = tracer.enabled if tracer else False
+    tracer = request.app[TRACER_KEY]
     
-    return web.json_response({
-        'status': 'healthy',
-        'service': 'agent-lightning-bridge',
-        'tracing_enabled': enabled,
-        'active_sessions': len(current_sessions)
-    })
+    body = b''.join((
+        _HEALTH_PREFIX,
+        b'true' if tracer.enabled else b'false',
+        b',"active_sessions":',
+        str(len(current_sessions)).encode(),
+        b'}'
+    ))
+    return json_bytes_response(body)
 
 
 async def handle_stats(request):
-    """Get current statistics."""
-    global tracer, current_sessions
+    """
+    Get current statistics.
+    
+    Only a sample of active sessions is serialized; pass ?full=1 for all of them.
+    """
+    tracer = request.app[TRACER_KEY]
     
     stats = {
-        'enabled': tracer.enabled if tracer else False,
-        'active_sessions': len(current_sessions),
-        'sessions': current_sessions
+        'enabled': tracer.enabled,
+        'active_sessions': len(current_sessions)
     }
     
-    if tracer and tracer.enabled:
+    if request.query.get('full') == '1':
+        stats['sessions'] = {sid: session.to_dict() for sid, session in current_sessions.items()}
+    else:
+        stats['sample_sessions'] = {
+            sid: session.to_dict()
+            for sid, session in itertools.islice(current_sessions.items(), STATS_SAMPLE_SIZE)
+        }
+    
+    if tracer.enabled:
         stats['session_stats'] = tracer.get_session_stats()
     
-    return web.json_response(stats)
+    return json_response(stats)
+
+
+async def init_tracer(app):
+    """Create the tracer on the serving loop, before accepting traffic."""
+    app[TRACER_KEY] = OpenClawLightningTracer()
 
 
 async def init_app():
     """Initialize the web application."""
     app = web.Application()
     
+    # Pay tracer start-up cost before accepting traffic
+    app.on_startup.append(init_tracer)
+    
     # Routes
     app.router.add_post('/session/start', handle_session_start)
     app.router.add_post('/tool/trace', handle_tool_trace)
+    app.router.add_post('/tool/trace_batch', handle_tool_trace_batch)
     app.router.add_post('/session/reward', handle_session_reward)
     app.router.add_post('/session/end', handle_session_end)
     app.router.add_get('/health', handle_health)
@@ -261,14 +394,18 @@ def main():
     print("=" * 60)
     print(f"Port: {port}")
     print(f"Feature flag: ENABLE_AGENT_LIGHTNING={os.getenv('ENABLE_AGENT_LIGHTNING', 'false')}")
+    print(f"Event loop: {'uvloop' if uvloop else 'asyncio'}")
     print(f"Health check: http://localhost:{port}/health")
     print(f"Stats: http://localhost:{port}/stats")
     print("=" * 60)
     print()
     
+    # One loop, uvloop if available, for both app setup and serving
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    
     # Create and run app
-    app = asyncio.run(init_app())
-    web.run_app(app, host='localhost', port=port)
+    app = loop.run_until_complete(init_app())
+    web.run_app(app, host='localhost', port=port, loop=loop)
 
 
 if __name__ == '__main__':
@@ -14,6 +14,9 @@
  *   // Trace tool calls
  *   await lightning.traceTool('web_search', { query: 'test' });
  *   
+ *   // Or buffer them and send in one request per burst
+ *   lightning.queueToolTrace('read', { path: 'README.md' });
+ *   
  *   // Emit reward
  *   await lightning.emitReward({ success: true, tokensUsed: 500 });
  *   
@@ -39,6 +42,11 @@ export interface ToolTraceData {
   params?: Record<string, any>;
 }
 
+export interface BatchedToolTrace {
+  tool_name: string;
+  params?: Record<string, any>;
+}
+
 export interface RewardData {
   session_id: string;
   success: boolean;
@@ -50,14 +58,22 @@ export interface RewardData {
 export interface SessionStats {
   enabled: boolean;
   active_sessions: number;
-  sessions: Record<string, any>;
+  /** Every active session; only returned when stats are requested with `full`. */
+  sessions?: Record<string, any>;
+  /** Up to 10 active sessions; returned by default. */
+  sample_sessions?: Record<string, any>;
   session_stats?: Record<string, any>;
 }
 
+// Queued tool traces are flushed once no new trace arrives for this long
+const TOOL_TRACE_DEBOUNCE_MS = 50;
+
 export class LightningClient {
   private config: Required<LightningConfig>;
   private currentSessionId: string | null = null;
   private sessionStartTime: number | null = null;
+  private pendingToolTraces: BatchedToolTrace[] = [];
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
 
   constructor(config: LightningConfig = {}) {
     this.config = {
@@ -93,12 +109,14 @@ export class LightningClient {
 
   /**
    * Get current statistics from bridge service
+   *
+   * Pass `full` to list every active session instead of a sample.
    */
-  async getStats(): Promise<SessionStats | null> {
+  async getStats(full: boolean = false): Promise<SessionStats | null> {
     if (!this.config.enabled) return null;
 
     try {
-      const response = await fetch(`${this.config.bridgeUrl}/stats`, {
+      const response = await fetch(`${this.config.bridgeUrl}/stats${full ? '?full=1' : ''}`, {
         signal: AbortSignal.timeout(this.config.timeout),
       });
       if (!response.ok) return null;
@@ -115,6 +133,9 @@ export class LightningClient {
   async startSession(data: SessionStartData): Promise<boolean> {
     if (!this.config.enabled) return false;
 
+    // Send traces still queued for the previous session under its id
+    await this.flushToolTraces();
+
     try {
       const sessionId = data.session_id || `session-${Date.now()}`;
       this.currentSessionId = sessionId;
@@ -172,6 +193,65 @@ export class LightningClient {
     }
   }
 
+  /**
+   * Trace several tool calls in a single request
+   */
+  async traceToolBatch(tools: BatchedToolTrace[]): Promise<boolean> {
+    if (!this.config.enabled || !this.currentSessionId || tools.length === 0) return false;
+
+    try {
+      const response = await fetch(`${this.config.bridgeUrl}/tool/trace_batch`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          session_id: this.currentSessionId,
+          tools,
+        }),
+        signal: AbortSignal.timeout(this.config.timeout),
+      });
+
+      if (!response.ok) {
+        console.error('Failed to trace tool batch:', response.statusText);
+        return false;
+      }
+
+      const result = await response.json();
+      return result.success;
+    } catch (error) {
+      // Don't log - this happens frequently and shouldn't spam logs
+      return false;
+    }
+  }
+
+  /**
+   * Buffer a tool call; buffered calls are sent together via traceToolBatch()
+   * once no new call has been queued for TOOL_TRACE_DEBOUNCE_MS.
+   */
+  queueToolTrace(toolName: string, params: Record<string, any> = {}): void {
+    if (!this.config.enabled || !this.currentSessionId) return;
+
+    this.pendingToolTraces.push({ tool_name: toolName, params });
+    if (this.flushTimer) clearTimeout(this.flushTimer);
+    this.flushTimer = setTimeout(() => {
+      void this.flushToolTraces();
+    }, TOOL_TRACE_DEBOUNCE_MS);
+  }
+
+  /**
+   * Send any buffered tool calls now
+   */
+  async flushToolTraces(): Promise<boolean> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+
+    const tools = this.pendingToolTraces;
+    this.pendingToolTraces = [];
+    if (tools.length === 0) return true;
+    return this.traceToolBatch(tools);
+  }
+
   /**
    * Emit reward for completed task
    */
@@ -215,6 +295,9 @@ export class LightningClient {
   async endSession(): Promise<boolean> {
     if (!this.config.enabled || !this.currentSessionId) return false;
 
+    // Don't drop tool calls still waiting on the debounce
+    await this.flushToolTraces();
+
     try {
       const response = await fetch(`${this.config.bridgeUrl}/session/end`, {
         method: 'POST',
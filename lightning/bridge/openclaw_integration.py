@@ -25,11 +25,10 @@ Usage:
 """
 
 import os
+import sys
 import asyncio
 import time
-from typing import Optional, Dict, Any, Callable
-from contextlib import contextmanager
-from pathlib import Path
+from typing import Optional, Dict, Any, Callable, ContextManager
 import logging
 
 # Safe imports with fallback
@@ -41,6 +40,109 @@ except ImportError:
     AGENT_LIGHTNING_AVAILABLE = False
     logging.warning("Agent Lightning not available - tracing disabled")
 
+# Span attribute values are truncated to this many characters
+MAX_ATTR_LENGTH = 200
+# Each container element renders as at least 3 characters (e.g. "1, "), so
+# containers above this size always overflow MAX_ATTR_LENGTH
+_SUMMARIZE_MIN_ITEMS = MAX_ATTR_LENGTH // 3
+
+
+# Span attribute keys, interned once and reused across tool calls
+_ATTR_TOOL_NAME = sys.intern("tool.name")
+_ATTR_TOOL_CALL_NUMBER = sys.intern("tool.call_number")
+_ATTR_KEY_CACHE: Dict[str, str] = {}
+
+
+def _attr_key(key: str) -> str:
+    """Return the interned "tool.<key>" attribute name for a tool kwarg."""
+    attr = _ATTR_KEY_CACHE.get(key)
+    if attr is None:
+        attr = _ATTR_KEY_CACHE[key] = sys.intern("tool." + key)
+    return attr
+
+
+def _clip_attr(value: Any) -> str:
+    """
+    Convert a tool kwarg to a span attribute string of bounded length.
+    
+    Short strings pass through without a copy. Containers too large to fit
+    are summarized rather than rendered, since their repr would mostly be
+    thrown away; smaller ones are rendered and clipped like any other value.
+    """
+    if type(value) is str:
+        return value if len(value) <= MAX_ATTR_LENGTH else value[:MAX_ATTR_LENGTH]
+    if isinstance(value, (dict, list, tuple, set)) and len(value) > _SUMMARIZE_MIN_ITEMS:
+        return f"<{type(value).__name__} len={len(value)}>"
+    text = str(value)
+    return text if len(text) <= MAX_ATTR_LENGTH else text[:MAX_ATTR_LENGTH]
+
+
+class _NoopCtx:
+    """Pass-through context manager for tool calls that are not traced."""
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> None:
+        return None
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_CTX = _NoopCtx()
+
+
+class _ToolSpanCtx:
+    """
+    Context manager that wraps one tool call in a span.
+    
+    A plain class rather than @contextmanager: no generator frame per call,
+    and exceptions from the wrapped code propagate unchanged.
+    """
+    
+    __slots__ = ('tracer', 'tool_name', 'kwargs', '_cm')
+    
+    def __init__(self, tracer: "OpenClawLightningTracer", tool_name: str, kwargs: Dict[str, Any]):
+        self.tracer = tracer
+        self.tool_name = tool_name
+        self.kwargs = kwargs
+        self._cm: Optional[Any] = None
+    
+    def __enter__(self) -> None:
+        tracer = self.tracer
+        try:
+            tracer.tool_call_count += 1
+            
+            cm = tracer.current_tracer_ctx.start_as_current_span(f"tool-{self.tool_name}")
+            span = cm.__enter__()
+            self._cm = cm
+            
+            # Add tool metadata
+            span.set_attribute(_ATTR_TOOL_NAME, self.tool_name)
+            span.set_attribute(_ATTR_TOOL_CALL_NUMBER, tracer.tool_call_count)
+            
+            # Add all kwargs as attributes
+            for key, value in self.kwargs.items():
+                span.set_attribute(_attr_key(key), _clip_attr(value))
+        
+        except Exception as e:
+            # Still execute the wrapped code even if tracing fails
+            tracer.logger.error("Error tracing tool %s: %s", self.tool_name, e)
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        cm = self._cm
+        if cm is None:
+            return False
+        self._cm = None
+        
+        try:
+            return bool(cm.__exit__(exc_type, exc, tb))
+        except Exception as e:
+            if e is exc:
+                raise
+            self.tracer.logger.error("Error tracing tool %s: %s", self.tool_name, e)
+            return False
+
 
 class OpenClawLightningTracer:
     """
@@ -50,16 +152,17 @@ class OpenClawLightningTracer:
     so the agent continues working normally.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize tracer with safety checks."""
-        self.enabled = self._check_enabled()
-        self.tracer = None
-        self.store = None
-        self.current_rollout = None
-        self.current_tracer_ctx = None
-        self.session_start_time = None
-        self.tool_call_count = 0
-        self.logger = logging.getLogger(__name__)
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.enabled: bool = self._check_enabled()
+        self.tracer: Optional[Any] = None
+        self.store: Optional[Any] = None
+        self.current_rollout: Optional[Any] = None
+        self.current_tracer_ctx: Optional[Any] = None
+        self.session_start_time: Optional[float] = None
+        self._session_start_ns: Optional[int] = None  # monotonic, for durations
+        self.tool_call_count: int = 0
         
         if self.enabled:
             try:
@@ -67,7 +170,7 @@ class OpenClawLightningTracer:
                 self.store = InMemoryLightningStore()
                 self.logger.info("✓ Agent Lightning tracing enabled")
             except Exception as e:
-                self.logger.error(f"Failed to initialize Agent Lightning: {e}")
+                self.logger.error("Failed to initialize Agent Lightning: %s", e)
                 self.enabled = False
     
     def _check_enabled(self) -> bool:
@@ -83,11 +186,17 @@ class OpenClawLightningTracer:
         
         return True
     
-    async def start_session(self, user_message: str, session_metadata: Optional[Dict[str, Any]] = None):
+    async def start_session(
+        self,
+        user_message: str,
+        session_metadata: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
+    ) -> None:
         """
         Start a new session (rollout) for tracking.
         
         Call this at the start of handling a user message.
+        session_id, if given, is recorded as bridge_session_id on the rollout input.
         Safe to call even if tracing is disabled - becomes no-op.
         """
         if not self.enabled:
@@ -95,15 +204,17 @@ class OpenClawLightningTracer:
         
         try:
             self.session_start_time = time.time()
+            self._session_start_ns = time.monotonic_ns()
             self.tool_call_count = 0
             
             input_data = {
                 "user_message": user_message,
-                "timestamp": self.session_start_time
+                "timestamp": self.session_start_time,
+                **(session_metadata or {})
             }
             
-            if session_metadata:
-                input_data.update(session_metadata)
+            if session_id is not None:
+                input_data["bridge_session_id"] = session_id
             
             self.current_rollout = await self.store.start_rollout(input=input_data)
             
@@ -117,17 +228,16 @@ class OpenClawLightningTracer:
                     attempt_id=self.current_rollout.attempt.attempt_id
                 ).__aenter__()
             except Exception as ctx_error:
-                self.logger.error(f"Failed to start trace context: {ctx_error}")
+                self.logger.error("Failed to start trace context: %s", ctx_error)
                 self.current_tracer_ctx = None
             
-            self.logger.debug(f"Started session tracking: {self.current_rollout.rollout_id}")
+            self.logger.debug("Started session tracking: %s", self.current_rollout.rollout_id)
         
         except Exception as e:
-            self.logger.error(f"Failed to start session: {e}")
+            self.logger.error("Failed to start session: %s", e)
             self.enabled = False  # Disable for this session to prevent cascading failures
     
-    @contextmanager
-    def trace_tool(self, tool_name: str, **kwargs):
+    def trace_tool(self, tool_name: str, **kwargs: Any) -> ContextManager[None]:
         """
         Context manager to trace a tool call.
         
@@ -138,26 +248,9 @@ class OpenClawLightningTracer:
         Safe to use even if tracing disabled - becomes pass-through.
         """
         if not self.enabled or not self.current_tracer_ctx:
-            yield  # No-op, just execute the wrapped code
-            return
-        
-        try:
-            self.tool_call_count += 1
-            
-            with self.current_tracer_ctx.start_as_current_span(f"tool-{tool_name}") as span:
-                # Add tool metadata
-                span.set_attribute("tool.name", tool_name)
-                span.set_attribute("tool.call_number", self.tool_call_count)
-                
-                # Add all kwargs as attributes
-                for key, value in kwargs.items():
-                    span.set_attribute(f"tool.{key}", str(value)[:200])  # Truncate long values
-                
-                yield
+            return _NOOP_CTX  # No-op, just execute the wrapped code
         
-        except Exception as e:
-            self.logger.error(f"Error tracing tool {tool_name}: {e}")
-            yield  # Still execute the wrapped code even if tracing fails
+        return _ToolSpanCtx(self, tool_name, kwargs)
     
     def emit_task_reward(
         self,
@@ -166,7 +259,7 @@ class OpenClawLightningTracer:
         expected_tokens: Optional[int] = None,
         duration_seconds: Optional[float] = None,
         user_rating: Optional[int] = None
-    ):
+    ) -> None:
         """
         Emit a reward for the completed task.
         
@@ -189,41 +282,33 @@ class OpenClawLightningTracer:
             return
         
         try:
-            # Base reward
-            reward = 1.0 if success else -0.5
-            
-            # Token efficiency bonus
-            if tokens_used and expected_tokens and tokens_used < expected_tokens:
-                reward += 0.1
-                self.logger.debug(f"Token efficiency bonus: {tokens_used}/{expected_tokens}")
-            
-            # Time efficiency bonus
-            if duration_seconds is None and self.session_start_time:
-                duration_seconds = time.time() - self.session_start_time
+            if duration_seconds is None and self._session_start_ns is not None:
+                duration_seconds = (time.monotonic_ns() - self._session_start_ns) * 1e-9
             
-            if duration_seconds and duration_seconds < 30.0:
-                reward += 0.1
-                self.logger.debug(f"Time efficiency bonus: {duration_seconds:.1f}s")
-            
-            # User feedback
-            if user_rating is not None:
-                feedback_bonus = (user_rating - 3) * 0.2
-                reward += feedback_bonus
-                self.logger.debug(f"User feedback bonus: {feedback_bonus:+.1f}")
+            # Base + token efficiency + time efficiency + user feedback, as one expression
+            reward = (
+                (1.0 if success else -0.5)
+                + 0.1 * bool(tokens_used and expected_tokens and tokens_used < expected_tokens)
+                + 0.1 * bool(duration_seconds and duration_seconds < 30.0)
+                + ((user_rating - 3) * 0.2 if user_rating is not None else 0.0)
+            )
+            self.logger.debug(
+                "Reward inputs: tokens=%s/%s, duration=%s, rating=%s",
+                tokens_used, expected_tokens, duration_seconds, user_rating
+            )
             
             # Emit the reward
             emit_reward(reward)
             
             self.logger.info(
-                f"Task reward: {reward:+.2f} "
-                f"(success={success}, tools={self.tool_call_count}, "
-                f"duration={duration_seconds:.1f}s)"
+                "Task reward: %+.2f (success=%s, tools=%d, duration=%.1fs)",
+                reward, success, self.tool_call_count, duration_seconds
             )
         
         except Exception as e:
-            self.logger.error(f"Failed to emit reward: {e}")
+            self.logger.error("Failed to emit reward: %s", e)
     
-    async def end_session(self):
+    async def end_session(self) -> None:
         """
         End the current session and clean up.
         
@@ -240,26 +325,27 @@ class OpenClawLightningTracer:
             
             # No need to explicitly exit tracer.lifespan - it's handled by context
             
-            if self.session_start_time:
-                duration = time.time() - self.session_start_time
-                self.logger.debug(f"Session ended: {duration:.2f}s, {self.tool_call_count} tools")
+            if self._session_start_ns is not None:
+                duration = (time.monotonic_ns() - self._session_start_ns) * 1e-9
+                self.logger.debug("Session ended: %.2fs, %d tools", duration, self.tool_call_count)
             
             self.current_rollout = None
             self.session_start_time = None
+            self._session_start_ns = None
             self.tool_call_count = 0
         
         except Exception as e:
-            self.logger.error(f"Failed to end session: {e}")
+            self.logger.error("Failed to end session: %s", e)
     
     def get_session_stats(self) -> Dict[str, Any]:
         """Get current session statistics."""
-        if not self.enabled or not self.session_start_time:
+        if not self.enabled or self._session_start_ns is None:
             return {}
         
         return {
             "enabled": self.enabled,
             "rollout_id": self.current_rollout.rollout_id if self.current_rollout else None,
-            "duration_seconds": time.time() - self.session_start_time,
+            "duration_seconds": (time.monotonic_ns() - self._session_start_ns) * 1e-9,
             "tool_call_count": self.tool_call_count
         }
 
@@ -284,7 +370,7 @@ def get_tracer() -> OpenClawLightningTracer:
 # Integration Example (for documentation)
 # ============================================================================
 
-async def example_integration():
+async def example_integration() -> None:
     """
     Example showing how to integrate Agent Lightning into OpenClaw.
     
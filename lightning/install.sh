@@ -58,7 +58,7 @@ echo "📦 Installing Agent Lightning..."
 source venv/bin/activate
 pip install -q --upgrade pip
 pip install -q -e .
-pip install -q aiohttp  # For bridge service
+pip install -q "aiohttp>=3.12" orjson uvloop  # For bridge service
 
 echo "✓ Agent Lightning installed"
 